@@ -1,49 +1,136 @@
 #!/usr/bin/env python3
 import os
 import sys
-import requests
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from urllib.parse import urlencode
+import logging
+import time
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import orjson
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple, TypedDict
 from fastmcp import FastMCP
 
+if TYPE_CHECKING:
+    import httpx
+
 mcp = FastMCP("PowerSchool MCP Server")
 
-# Global variable to cache the authentication token
-_auth_cache = {
-    "token": None,
-    "expires_at": None
-}
+logger = logging.getLogger(__name__)
+
+# Fail fast on unreachable hosts, but give slow PowerSchool endpoints time to respond
+REQUEST_CONNECT_TIMEOUT = 3.05
+REQUEST_READ_TIMEOUT = 27
+
+# Retry policy for transient upstream failures; POSTs are only retried on connection errors
+RETRY_TOTAL = 4
+RETRY_READ = 2
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "PUT", "DELETE"})
+# Longest Retry-After we honour; waits run inside shared in-flight requests
+RETRY_AFTER_MAX = 30
+
+def _retry_delay(attempt: int, response: Optional["httpx.Response"] = None) -> float:
+    """Seconds to wait before retry number `attempt`, honouring Retry-After (up to RETRY_AFTER_MAX) when given"""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), RETRY_AFTER_MAX)
+    return RETRY_BACKOFF_FACTOR * (2 ** attempt)
+
+def _resolve_credentials(*credentials: Optional[str]) -> Tuple[str, ...]:
+    """Resolve (base_url, client_id, client_secret, username, password).
+    
+    The environment is only used when no credential is passed explicitly, so one tenant
+    never inherits another's values (e.g. the default student's username and password).
+    """
+    if any(credentials):
+        return tuple(value or "" for value in credentials)
+    return (
+        os.environ.get("POWERSCHOOL_URL", ""),
+        os.environ.get("POWERSCHOOL_CLIENT_ID", ""),
+        os.environ.get("POWERSCHOOL_CLIENT_SECRET", ""),
+        os.environ.get("POWERSCHOOL_USERNAME", ""),
+        os.environ.get("POWERSCHOOL_PASSWORD", "")
+    )
+
+# Strong references to fire-and-forget tasks so they aren't garbage-collected before running
+_background_tasks: set = set()
+
+def _spawn(coro) -> None:
+    """Run `coro` in the background on the running event loop, if there is one"""
+    try:
+        task = asyncio.get_running_loop().create_task(coro)
+    except RuntimeError:
+        # No loop means nothing async (connections, refresh tasks) was ever started
+        coro.close()
+        return
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+class _TokenResponseRequired(TypedDict):
+    access_token: str
+
+class TokenResponse(_TokenResponseRequired, total=False):
+    """Body of a PowerSchool /oauth/access_token response"""
+    token_type: str
+    expires_in: int
+    refresh_token: str
+    scope: str
+
+# Upper bound on cached responses per client; keys include tool arguments such as dates
+MAX_CACHE_ENTRIES = 256
+
+def _lru_put(cache: OrderedDict, key: Tuple, value: Any) -> None:
+    """Store `value` as the most recently used entry, evicting the oldest beyond MAX_CACHE_ENTRIES"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > MAX_CACHE_ENTRIES:
+        cache.popitem(last=False)
+
+def cached(ttl: float):
+    """Cache a PowerSchoolAPI read method's result per arguments for `ttl` seconds.
+    
+    Pass refresh=True to the decorated method to bypass and replace the cached entry.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, refresh: bool = False, **kwargs):
+            key = (func.__name__, args, frozenset(kwargs.items()))
+            if not refresh:
+                entry = self._cache.get(key)
+                if entry:
+                    if time.monotonic() - entry[0] < ttl:
+                        self._cache.move_to_end(key)
+                        return entry[1]
+                    del self._cache[key]
+            result = await func(self, *args, **kwargs)
+            _lru_put(self._cache, key, (time.monotonic(), result))
+            return result
+        return wrapper
+    return decorator
 
 class PowerSchoolAPI:
     """Client for PowerSchool API interactions"""
     
-    def __init__(self):
-        self.base_url = os.environ.get("POWERSCHOOL_URL", "").rstrip("/")
-        self.client_id = os.environ.get("POWERSCHOOL_CLIENT_ID", "")
-        self.client_secret = os.environ.get("POWERSCHOOL_CLIENT_SECRET", "")
-        self.username = os.environ.get("POWERSCHOOL_USERNAME", "")
-        self.password = os.environ.get("POWERSCHOOL_PASSWORD", "")
+    def __init__(self, base_url: Optional[str] = None, client_id: Optional[str] = None,
+                 client_secret: Optional[str] = None, username: Optional[str] = None,
+                 password: Optional[str] = None):
+        base_url, self.client_id, self.client_secret, self.username, self.password = _resolve_credentials(
+            base_url, client_id, client_secret, username, password
+        )
+        self.base_url = base_url.rstrip("/")
         
         if not all([self.base_url, self.client_id, self.client_secret]):
             raise ValueError("PowerSchool configuration incomplete. Set POWERSCHOOL_URL, POWERSCHOOL_CLIENT_ID, and POWERSCHOOL_CLIENT_SECRET environment variables.")
-    
-    def _get_token(self) -> str:
-        """Get or refresh authentication token"""
-        global _auth_cache
-        
-        # Check if we have a valid cached token
-        if _auth_cache["token"] and _auth_cache["expires_at"]:
-            if datetime.now() < _auth_cache["expires_at"]:
-                return _auth_cache["token"]
         
-        # Request new token
-        auth_url = f"{self.base_url}/oauth/access_token"
-        
-        # PowerSchool supports both client credentials and password grant types
+        # PowerSchool supports both client credentials and password grant types;
+        # the grant is fixed by the configuration, so its form body is built once
         if self.username and self.password:
             # Password grant type for student login
-            data = {
+            self._auth_body = {
                 "grant_type": "password",
                 "client_id": self.client_id,
                 "client_secret": self.client_secret,
@@ -52,117 +139,366 @@ class PowerSchoolAPI:
             }
         else:
             # Client credentials grant type
-            data = {
+            self._auth_body = {
                 "grant_type": "client_credentials",
                 "client_id": self.client_id,
                 "client_secret": self.client_secret
             }
         
+        # Full endpoint URLs, built once instead of on every request
+        self._urls = {
+            "token": f"{self.base_url}/oauth/access_token",
+            "student": f"{self.base_url}/ws/v1/student",
+            "grades": f"{self.base_url}/ws/v1/student/grades",
+            "grade_history": f"{self.base_url}/ws/v1/student/grades/history",
+            "assignments": f"{self.base_url}/ws/v1/student/assignments",
+            "sections": f"{self.base_url}/ws/v1/student/sections",
+            "attendance": f"{self.base_url}/ws/v1/student/attendance"
+        }
+        
+        # Imported here so server startup doesn't pay for the HTTP stack until the first tool call
+        import httpx
+        self._httpx = httpx
+        
+        # HTTP/2 multiplexes concurrent tool calls as streams over one TLS connection;
+        # without the h2 package httpx would refuse to start, so fall back to pooled HTTP/1.1
+        self.http2 = importlib.util.find_spec("h2") is not None
+        if not self.http2:
+            logger.warning("h2 is not installed; using HTTP/1.1 connections to PowerSchool (install httpx[http2])")
+        
+        # Only advertise brotli when it can be decoded; otherwise httpx hands back the raw compressed body
+        brotli_available = any(importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+        accept_encoding = "br, gzip, deflate" if brotli_available else "gzip, deflate"
+        
+        # Pooled client so concurrent tool calls share connections to PowerSchool
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(REQUEST_READ_TIMEOUT, connect=REQUEST_CONNECT_TIMEOUT),
+            # Match requests' behaviour: PowerSchool may redirect (http->https, moved host)
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                http2=self.http2,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                # Connection failures happen before anything is sent, so every method can retry them
+                retries=3
+            ),
+            # Authorization is added once a token is issued; httpx sets Content-Type for JSON bodies
+            headers={"Accept": "application/json", "Accept-Encoding": accept_encoding}
+        )
+        
+        # Responses of read-only endpoints in LRU order, keyed by method and arguments: (stored_at, data)
+        self._cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        # Upstream GETs currently in flight, keyed by (method, url, params)
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        # Last GET body per (url, params) with its ETag and Last-Modified, for conditional revalidation
+        # (LRU order, same bound as the response cache)
+        self._validators: "OrderedDict[Tuple, Tuple[Optional[str], Optional[str], Dict]]" = OrderedDict()
+        # Whether the negotiated response compression has been logged yet
+        self._encoding_logged = False
+        
+        # OAuth token state; the lock ensures only one caller refreshes at a time
+        self._token: Optional[str] = None
+        self._refresh_token: Optional[str] = None
+        # time.monotonic() deadline, immune to wall-clock adjustments
+        self._expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # Requests currently using the client, and whether it should close once they finish
+        self._active_requests = 0
+        self._retired = False
+    
+    async def close(self) -> None:
+        """Close pooled connections held by the client"""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+        await self._client.aclose()
+    
+    def retire(self) -> None:
+        """Close the client once no requests are using it"""
+        self._retired = True
+        _spawn(self._close_if_idle())
+    
+    async def _close_if_idle(self) -> None:
+        """Close a retired client unless requests are still running; the last one re-triggers this"""
+        if self._retired and not self._active_requests and not self._client.is_closed:
+            await self.close()
+    
+    def cache_clear(self) -> None:
+        """Drop all cached endpoint responses"""
+        self._cache.clear()
+        self._validators.clear()
+    
+    def _token_valid(self) -> bool:
+        """Whether the cached token can still be used"""
+        return bool(self._token) and time.monotonic() < self._expires_at
+    
+    async def _get_token(self) -> str:
+        """Get or refresh authentication token"""
+        # Fast path without the lock; re-checked under it so concurrent callers refresh once
+        if self._token_valid():
+            return self._token
+        
+        async with self._token_lock:
+            if self._token_valid():
+                return self._token
+            return await self._fetch_token()
+    
+    async def _fetch_token(self) -> str:
+        """Request a new authentication token; caller must hold the token lock"""
+        # Renew with the refresh token when we have one, avoiding a full credential exchange
+        if self._refresh_token:
+            data = {
+                "grant_type": "refresh_token",
+                "refresh_token": self._refresh_token,
+                "client_id": self.client_id,
+                "client_secret": self.client_secret
+            }
+            try:
+                return await self._request_token(data)
+            except ConnectionError as e:
+                # A rejected refresh token falls back to the full grant below
+                cause = e.__cause__
+                if not isinstance(cause, self._httpx.HTTPStatusError) or cause.response.status_code not in (400, 401):
+                    raise
+                self._refresh_token = None
+        
+        return await self._request_token(self._auth_body)
+    
+    async def _request_token(self, data: Dict) -> str:
+        """POST a token grant to PowerSchool and store the resulting token"""
         try:
-            response = requests.post(auth_url, data=data, timeout=30)
+            # The bearer header on the client is for API calls; a stale one must not reach the token endpoint
+            request = self._client.build_request("POST", self._urls["token"], data=data)
+            request.headers.pop("Authorization", None)
+            response = await self._client.send(request)
             response.raise_for_status()
             
-            token_data = response.json()
-            _auth_cache["token"] = token_data["access_token"]
+            token_data: TokenResponse = orjson.loads(response.content)
+            if not isinstance(token_data, dict) or "access_token" not in token_data:
+                raise ValueError("Invalid token response from PowerSchool authentication: missing access_token")
+            self._token = token_data["access_token"]
+            # Servers may rotate the refresh token on every grant
+            self._refresh_token = token_data.get("refresh_token", self._refresh_token)
             # Set expiration to 5 minutes before actual expiration for safety
             expires_in = token_data.get("expires_in", 3600)
-            _auth_cache["expires_at"] = datetime.now() + timedelta(seconds=expires_in - 300)
+            self._expires_at = time.monotonic() + (expires_in - 300)
+            self._client.headers["Authorization"] = f"Bearer {self._token}"
+            self._schedule_refresh(expires_in - 600)
             
-            return _auth_cache["token"]
-        except requests.exceptions.JSONDecodeError as e:
+            return self._token
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON response from PowerSchool authentication: {e}")
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"Failed to authenticate with PowerSchool: {e}")
-    
-    def _make_request(self, endpoint: str, method: str = "GET", data: Optional[Dict] = None) -> Dict:
-        """Make authenticated request to PowerSchool API"""
-        token = self._get_token()
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+        except self._httpx.HTTPError as e:
+            raise ConnectionError(f"Failed to authenticate with PowerSchool: {e}") from e
+    
+    def _schedule_refresh(self, delay: float) -> None:
+        """Refresh the token in the background `delay` seconds from now"""
+        if self._refresh_task and self._refresh_task is not asyncio.current_task():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+        # Short-lived tokens are left to the request path
+        if delay > 0:
+            self._refresh_task = asyncio.create_task(self._refresh_later(delay))
+    
+    async def _refresh_later(self, delay: float) -> None:
+        """Background task that renews the token before requests would have to"""
+        await asyncio.sleep(delay)
+        async with self._token_lock:
+            try:
+                await self._fetch_token()
+            except Exception:
+                # The request path retries once the current token expires
+                logger.debug("Background token refresh failed", exc_info=True)
+    
+    async def _make_request(self, url: str, method: str = "GET", data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
+        """Make authenticated request to a full PowerSchool API URL"""
+        # The client dispatches any verb; normalise case so coalescing and retry checks match
+        method = method.upper()
+        
+        self._active_requests += 1
+        try:
+            # Only reads are coalesced; writes must reach PowerSchool once per caller
+            if method != "GET":
+                return await self._send_request(url, method, data, params)
+            
+            # Identical in-flight reads share a single upstream request
+            key = (method, url, frozenset(params.items()) if params else None)
+            task = self._inflight.get(key)
+            if task is None:
+                # The fetch runs in its own task so a caller going away doesn't cancel it for the others
+                task = asyncio.create_task(self._send_request(url, method, data, params))
+                self._inflight[key] = task
+                task.add_done_callback(functools.partial(self._inflight_done, key))
+            return await asyncio.shield(task)
+        finally:
+            self._active_requests -= 1
+            if self._retired and not self._active_requests:
+                _spawn(self._close_if_idle())
+    
+    def _inflight_done(self, key: Tuple, task: asyncio.Task) -> None:
+        """Forget a finished in-flight request"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark retrieved so an exception with no remaining waiters isn't logged as unhandled
+        if not task.cancelled():
+            task.exception()
+    
+    async def _send_request(self, url: str, method: str, data: Optional[Dict], params: Optional[Dict]) -> Dict:
+        """Send a single authenticated request to PowerSchool"""
+        await self._get_token()
+        retryable = method in RETRY_METHODS
         
-        url = f"{self.base_url}{endpoint}"
+        # Revalidate a previously fetched body so an unchanged resource comes back as a bodiless 304
+        validator_key = None
+        validated = None
+        headers = None
+        if method == "GET":
+            validator_key = (url, frozenset(params.items()) if params else None)
+            validated = self._validators.get(validator_key)
+            if validated:
+                self._validators.move_to_end(validator_key)
+                etag, last_modified, _ = validated
+                headers = {}
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
         
         try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, timeout=30)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, json=data, timeout=30)
-            elif method == "PUT":
-                response = requests.put(url, headers=headers, json=data, timeout=30)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers, timeout=30)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            for attempt in range(RETRY_TOTAL + 1):
+                try:
+                    response = await self._client.request(method, url, json=data, params=params, headers=headers)
+                except self._httpx.ReadTimeout:
+                    if not retryable or attempt >= RETRY_READ:
+                        raise
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                
+                if retryable and response.status_code in RETRY_STATUSES and attempt < RETRY_TOTAL:
+                    await asyncio.sleep(_retry_delay(attempt, response))
+                    continue
+                break
+            
+            if response.status_code == 304 and validated:
+                return validated[2]
             
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.JSONDecodeError as e:
+            if not self._encoding_logged:
+                self._encoding_logged = True
+                logger.debug("PowerSchool response Content-Encoding: %s", response.headers.get("Content-Encoding", "identity"))
+            result = orjson.loads(response.content)
+            
+            if validator_key is not None:
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    _lru_put(self._validators, validator_key, (etag, last_modified, result))
+                else:
+                    self._validators.pop(validator_key, None)
+            return result
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON response from PowerSchool: {e}")
-        except requests.exceptions.Timeout:
-            raise TimeoutError("Request to PowerSchool timed out after 30 seconds")
-        except requests.exceptions.RequestException as e:
+        except self._httpx.ConnectTimeout:
+            raise TimeoutError(f"Connecting to PowerSchool timed out (limit {REQUEST_CONNECT_TIMEOUT} seconds per attempt)")
+        except self._httpx.ReadTimeout:
+            raise TimeoutError(f"PowerSchool did not respond in time (limit {REQUEST_READ_TIMEOUT} seconds per attempt)")
+        except self._httpx.TimeoutException as e:
+            raise TimeoutError(f"Request to PowerSchool timed out ({type(e).__name__})")
+        except self._httpx.HTTPError as e:
             raise ConnectionError(f"Failed to connect to PowerSchool: {e}")
     
-    def get_student_info(self) -> Dict:
+    @cached(ttl=3600)
+    async def get_student_info(self) -> Dict:
         """Get current student information"""
-        return self._make_request("/ws/v1/student")
+        return await self._make_request(self._urls["student"])
     
-    def get_grades(self) -> Dict:
+    @cached(ttl=60)
+    async def get_grades(self) -> Dict:
         """Get current grades for the student"""
-        return self._make_request("/ws/v1/student/grades")
+        return await self._make_request(self._urls["grades"])
     
-    def get_assignments(self, section_id: Optional[int] = None) -> Dict:
+    @cached(ttl=120)
+    async def get_assignments(self, section_id: Optional[int] = None) -> Dict:
         """Get assignments, optionally filtered by section"""
         if section_id:
-            return self._make_request(f"/ws/v1/student/assignments/section/{section_id}")
-        return self._make_request("/ws/v1/student/assignments")
+            return await self._make_request(f"{self._urls['assignments']}/section/{section_id}")
+        return await self._make_request(self._urls["assignments"])
     
-    def get_grade_history(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict:
+    @cached(ttl=300)
+    async def get_grade_history(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict:
         """Get historical grades"""
-        endpoint = "/ws/v1/student/grades/history"
-        params = {}
-        if start_date:
-            params['startDate'] = start_date
-        if end_date:
-            params['endDate'] = end_date
-        
-        if params:
-            endpoint += "?" + urlencode(params)
-        
-        return self._make_request(endpoint)
+        params = {k: v for k, v in (("startDate", start_date), ("endDate", end_date)) if v}
+        return await self._make_request(self._urls["grade_history"], params=params)
     
-    def get_courses(self) -> Dict:
+    @cached(ttl=600)
+    async def get_courses(self) -> Dict:
         """Get student's current courses/sections"""
-        return self._make_request("/ws/v1/student/sections")
+        return await self._make_request(self._urls["sections"])
     
-    def get_attendance(self) -> Dict:
+    @cached(ttl=120)
+    async def get_attendance(self) -> Dict:
         """Get student attendance records"""
-        return self._make_request("/ws/v1/student/attendance")
+        return await self._make_request(self._urls["attendance"])
+    
+    async def get_dashboard(self, section_id: Optional[int] = None, refresh: bool = False) -> Tuple[Dict, Dict[str, str]]:
+        """Get student info, grades, courses, assignments and attendance concurrently.
+        
+        Returns (data, errors): sections that failed are reported in errors instead of data.
+        """
+        sections = {
+            "student": self.get_student_info(refresh=refresh),
+            "grades": self.get_grades(refresh=refresh),
+            "courses": self.get_courses(refresh=refresh),
+            "assignments": self.get_assignments(section_id, refresh=refresh),
+            "attendance": self.get_attendance(refresh=refresh)
+        }
+        results = await asyncio.gather(*sections.values(), return_exceptions=True)
+        
+        data = {}
+        errors = {}
+        for name, result in zip(sections, results):
+            if isinstance(result, BaseException):
+                errors[name] = str(result)
+            else:
+                data[name] = result
+        return data, errors
 
-# Initialize the API client (will be created on first use)
-_api_client = None
+# API clients are created on first use, one per distinct set of credentials,
+# keeping the most recently used ones; evicted clients close once their requests finish
+MAX_API_CLIENTS = 16
+_api_clients: Dict[str, PowerSchoolAPI] = {}
 
-def get_api_client() -> PowerSchoolAPI:
-    """Get or create the PowerSchool API client"""
-    global _api_client
-    if _api_client is None:
-        _api_client = PowerSchoolAPI()
-    return _api_client
+def get_api_client(base_url: Optional[str] = None, client_id: Optional[str] = None,
+                   client_secret: Optional[str] = None, username: Optional[str] = None,
+                   password: Optional[str] = None) -> PowerSchoolAPI:
+    """Get or create the PowerSchool API client for the given credentials (environment by default)"""
+    credentials = _resolve_credentials(base_url, client_id, client_secret, username, password)
+    # Hashed so raw secrets aren't used as registry keys
+    key = hashlib.sha256("\0".join(credentials).encode()).hexdigest()
+    client = _api_clients.pop(key, None)
+    if client is None:
+        client = PowerSchoolAPI(*credentials)
+        while len(_api_clients) >= MAX_API_CLIENTS:
+            evicted = _api_clients.pop(next(iter(_api_clients)))
+            evicted.retire()
+    # Re-inserted so dict order tracks recency of use
+    _api_clients[key] = client
+    return client
 
 @mcp.tool(description="Get current student information including name, grade level, school, and student ID")
-def get_student_info() -> dict:
+async def get_student_info(refresh: bool = False) -> dict:
     """
     Retrieve basic information about the logged-in student.
     
+    Args:
+        refresh: Bypass the cached response and fetch fresh data from PowerSchool
+        
     Returns:
         dict: Student information including name, student ID, grade level, and school
     """
     try:
         client = get_api_client()
-        result = client.get_student_info()
+        result = await client.get_student_info(refresh=refresh)
         return {
             "success": True,
             "data": result
@@ -174,17 +510,20 @@ def get_student_info() -> dict:
         }
 
 @mcp.tool(description="Get current grades for all courses")
-def get_current_grades() -> dict:
+async def get_current_grades(refresh: bool = False) -> dict:
     """
     Retrieve the student's current grades for all enrolled courses.
     Shows letter grades, percentage scores, and course information.
     
+    Args:
+        refresh: Bypass the cached response and fetch fresh data from PowerSchool
+        
     Returns:
         dict: Current grades for all courses including letter grade, percentage, and course details
     """
     try:
         client = get_api_client()
-        result = client.get_grades()
+        result = await client.get_grades(refresh=refresh)
         return {
             "success": True,
             "data": result
@@ -196,19 +535,20 @@ def get_current_grades() -> dict:
         }
 
 @mcp.tool(description="Get list of assignments, optionally filtered by course section ID")
-def get_assignments(section_id: Optional[int] = None) -> dict:
+async def get_assignments(section_id: Optional[int] = None, refresh: bool = False) -> dict:
     """
     Retrieve assignments for the student. Can be filtered by a specific course section.
     
     Args:
         section_id: Optional course section ID to filter assignments for a specific class
+        refresh: Bypass the cached response and fetch fresh data from PowerSchool
         
     Returns:
         dict: List of assignments with details like name, due date, score, and status
     """
     try:
         client = get_api_client()
-        result = client.get_assignments(section_id)
+        result = await client.get_assignments(section_id, refresh=refresh)
         return {
             "success": True,
             "data": result,
@@ -221,20 +561,21 @@ def get_assignments(section_id: Optional[int] = None) -> dict:
         }
 
 @mcp.tool(description="Get historical grade data with optional date range filtering")
-def get_grade_history(start_date: Optional[str] = None, end_date: Optional[str] = None) -> dict:
+async def get_grade_history(start_date: Optional[str] = None, end_date: Optional[str] = None, refresh: bool = False) -> dict:
     """
     Retrieve historical grade data for the student. Useful for tracking grade changes over time.
     
     Args:
         start_date: Optional start date in YYYY-MM-DD format
         end_date: Optional end date in YYYY-MM-DD format
+        refresh: Bypass the cached response and fetch fresh data from PowerSchool
         
     Returns:
         dict: Historical grade information showing how grades have changed over the specified period
     """
     try:
         client = get_api_client()
-        result = client.get_grade_history(start_date, end_date)
+        result = await client.get_grade_history(start_date, end_date, refresh=refresh)
         return {
             "success": True,
             "data": result,
@@ -248,17 +589,20 @@ def get_grade_history(start_date: Optional[str] = None, end_date: Optional[str]
         }
 
 @mcp.tool(description="Get list of current courses/sections the student is enrolled in")
-def get_courses() -> dict:
+async def get_courses(refresh: bool = False) -> dict:
     """
     Retrieve all courses (sections) that the student is currently enrolled in.
     Includes course names, teachers, periods, and section IDs.
     
+    Args:
+        refresh: Bypass the cached response and fetch fresh data from PowerSchool
+        
     Returns:
         dict: List of courses with details like course name, teacher, period, and section ID
     """
     try:
         client = get_api_client()
-        result = client.get_courses()
+        result = await client.get_courses(refresh=refresh)
         return {
             "success": True,
             "data": result
@@ -270,16 +614,19 @@ def get_courses() -> dict:
         }
 
 @mcp.tool(description="Get student attendance records")
-def get_attendance() -> dict:
+async def get_attendance(refresh: bool = False) -> dict:
     """
     Retrieve attendance records for the student showing present, absent, tardy, and excused status.
     
+    Args:
+        refresh: Bypass the cached response and fetch fresh data from PowerSchool
+        
     Returns:
         dict: Attendance records with dates, status, and any related notes
     """
     try:
         client = get_api_client()
-        result = client.get_attendance()
+        result = await client.get_attendance(refresh=refresh)
         return {
             "success": True,
             "data": result
@@ -290,6 +637,35 @@ def get_attendance() -> dict:
             "error": str(e)
         }
 
+@mcp.tool(description="Get a combined snapshot of student info, grades, courses, assignments, and attendance in one call")
+async def get_dashboard(section_id: Optional[int] = None, refresh: bool = False) -> dict:
+    """
+    Retrieve student info, current grades, courses, assignments, and attendance concurrently.
+    Sections that fail are reported under "errors" without discarding the others.
+    
+    Args:
+        section_id: Optional course section ID to filter assignments for a specific class
+        refresh: Bypass the cached responses and fetch fresh data from PowerSchool
+        
+    Returns:
+        dict: Data keyed by section (student, grades, courses, assignments, attendance) plus any per-section errors
+    """
+    try:
+        client = get_api_client()
+        data, errors = await client.get_dashboard(section_id, refresh=refresh)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+    
+    return {
+        "success": bool(data),
+        "data": data,
+        "errors": errors,
+        "section_id": section_id
+    }
+
 @mcp.tool(description="Get comprehensive information including server status and configuration check")
 def get_server_info() -> dict:
     """